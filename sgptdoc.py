@@ -2,15 +2,64 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 import os
+import subprocess
+import sys
 import uuid
+from functools import partial
 from pathlib import Path
 
+# orjson is much faster at encoding/decoding; fall back to stdlib json.
+# Storage is compact; pretty=True is for files meant to be read by people.
+try:
+    import orjson
+
+    def _dumps(obj, pretty=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj, pretty=False):
+        if pretty:
+            return json.dumps(obj, indent=4, ensure_ascii=False).encode('utf-8')
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    _loads = json.loads
+
+
+def _write_atomic(path, payload):
+    """Write to a temp file and swap it in, so a crash never leaves a half-written file"""
+    tmp = path.with_suffix('.json.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except Exception:
+        # Don't leave a stray .tmp behind for every failed save
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Pick the platform's file-explorer opener once
+if sys.platform == "win32":
+    def _open_folder(path):
+        os.startfile(path)
+elif sys.platform == "darwin":
+    def _open_folder(path):
+        subprocess.Popen(['open', str(path)])
+else:
+    def _open_folder(path):
+        subprocess.Popen(['xdg-open', str(path)])
+
+
 # --- 🎨 SETTINGS --- #
 APP_NAME = "NotePad"
 
 # Get Documents folder path
 DOCUMENTS_FOLDER = Path.home() / "Documents"
 NOTES_FOLDER = DOCUMENTS_FOLDER / "StickyNotes"
+# Each note is stored as <note_id>.json in here
+NOTES_DATA_FOLDER = NOTES_FOLDER / "notes"
+# Old single-file storage, split into per-note files on first load
 DATA_FILE = NOTES_FOLDER / "stickynotes_data.json"
 
 # Colors: (Background, Accent, Text, Hover)
@@ -22,10 +71,24 @@ COLOR_THEMES = {
     "Blue":   ("#cbf0f8", "#e5faff", "#202124", "#b3e9ff"),
     "Gray":   ("#e6e6e6", "#f2f2f2", "#202124", "#d9d9d9"),
 }
+# Menu order and matching color tuples, precomputed once
+THEME_ORDER = tuple(COLOR_THEMES)
+THEME_TUPLES = tuple(COLOR_THEMES[name] for name in THEME_ORDER)
 
 DEFAULT_THEME = "Yellow"
 SMALL_SIZE = (280, 300)
 BIG_SIZE = (500, 450)
+# Delay before a burst of edits/moves is flushed to disk
+SAVE_DELAY_MS = 400
+# Shown in front of each to-do item; not part of the saved text
+TODO_BULLET = "● "
+
+# ttk style names, shared by every window using the same theme
+NOTEBOOK_STYLE = "{}.TNotebook"
+BAR_BTN_STYLE = "{}.Bar.TButton"
+# Inherits the bar button colors, only the font differs
+RESIZE_BTN_STYLE = "Plain.{}.Bar.TButton"
+TODO_BTN_STYLE = "{}.Todo.TButton"
 
 
 class NoteManager:
@@ -33,10 +96,17 @@ class NoteManager:
         self.root = tk.Tk()
         self.root.withdraw()
 
+        # ttk styles are process-wide; pick the base theme once
+        self.style = ttk.Style()
+        self.style.theme_use('clam')
+        self._styled_themes = set()
+
         # Create notes folder if it doesn't exist
         self.create_notes_folder()
 
         self.open_windows = []
+        self._saved_hashes = {}
+        self._loading = False
         self.load_notes()
 
         if not self.open_windows:
@@ -47,91 +117,183 @@ class NoteManager:
     def create_notes_folder(self):
         """Create the StickyNotes folder in Documents if it doesn't exist"""
         try:
-            NOTES_FOLDER.mkdir(exist_ok=True)
+            NOTES_DATA_FOLDER.mkdir(parents=True, exist_ok=True)
             print(f"Notes folder created at: {NOTES_FOLDER}")
         except Exception as e:
             print(f"Error creating notes folder: {e}")
 
+    def setup_theme_styles(self, theme_name):
+        """Create the ttk styles for a color theme the first time it's used"""
+        if theme_name in self._styled_themes:
+            return
+        bg_color, accent_color, text_color, hover_color = COLOR_THEMES[theme_name]
+        style = self.style
+
+        nb_style = NOTEBOOK_STYLE.format(theme_name)
+        tab_style = f"{nb_style}.Tab"
+        style.configure(nb_style, background=bg_color, borderwidth=0)
+        style.configure(tab_style,
+                        background=accent_color,
+                        foreground=text_color,
+                        padding=[20, 8],
+                        borderwidth=0,
+                        focuscolor=bg_color,
+                        font=("Segoe UI", 9, "bold"))
+        style.map(tab_style,
+                  background=[('selected', bg_color)],
+                  foreground=[('selected', text_color)])
+
+        # Hover buttons - ttk switches to the hover color natively
+        for btn_style, default_bg in ((BAR_BTN_STYLE.format(theme_name), bg_color),
+                                      (TODO_BTN_STYLE.format(theme_name), accent_color)):
+            style.configure(btn_style,
+                            relief="flat",
+                            borderwidth=1,
+                            padding=[6, 2],
+                            font=("Segoe UI", 9, "bold"),
+                            background=default_bg,
+                            foreground=text_color,
+                            bordercolor=default_bg,
+                            lightcolor=default_bg,
+                            darkcolor=default_bg,
+                            focuscolor=default_bg)
+            style.map(btn_style,
+                      background=[('pressed', hover_color), ('active', hover_color)],
+                      lightcolor=[('active', hover_color)],
+                      darkcolor=[('active', hover_color)])
+        style.configure(RESIZE_BTN_STYLE.format(theme_name), font=("Segoe UI", 9))
+
+        self._styled_themes.add(theme_name)
+
     def create_new_note(self, note_data=None):
         new_window = NoteWindow(self, note_data)
         self.open_windows.append(new_window)
 
-    def delete_note(self, window_instance):
+    def close_note(self, window_instance, delete=False):
+        """Close a note window, saving it first or deleting its file"""
         if window_instance in self.open_windows:
             self.open_windows.remove(window_instance)
-            self.save_all_notes()
-            window_instance.destroy()
-            if not self.open_windows:
-                self.root.destroy()
-
-    def save_all_notes(self):
-        """Save all notes data to JSON file in Documents/StickyNotes folder"""
-        all_data = []
-        for window in self.open_windows:
-            all_data.append(window.get_data())
+        if delete:
+            self.remove_note_file(window_instance.note_id)
+        else:
+            # Always snapshot the final position/size when closing
+            window_instance._dirty = True
+            self.save_note(window_instance)
+        window_instance.destroy()
+        if not self.open_windows:
+            self.root.destroy()
 
+    def note_path(self, note_id):
+        return NOTES_DATA_FOLDER / f"{note_id}.json"
+
+    def save_note(self, window):
+        """Save a single note to its own JSON file"""
+        # Untouched windows skip get_data() and its Tcl round-trips entirely
+        if self._loading or not window._dirty:
+            return
+        data = window.get_data()
+
+        # Empty notes aren't kept on disk (and a note that was emptied
+        # must not come back with its old content)
+        if not data["notes"] and not data["todo"]:
+            self.remove_note_file(window.note_id)
+            window._dirty = False
+            return
+
+        # Nothing changed since the last successful write - skip it
+        h = self.note_hash(data)
+        if h != self._saved_hashes.get(window.note_id):
+            path = self.note_path(window.note_id)
+            try:
+                _write_atomic(path, _dumps(data))
+                self._saved_hashes[window.note_id] = h
+                print(f"Note saved to: {path}")
+            except Exception as e:
+                # Stay dirty so the next save retries
+                print(f"Error saving note: {e}")
+                return
+        window._dirty = False
+
+    @staticmethod
+    def note_hash(data):
+        return hash((data["theme"], data["notes"], tuple(data["todo"]),
+                     tuple(data["pos"]), tuple(data["size"])))
+
+    def remove_note_file(self, note_id):
+        self._saved_hashes.pop(note_id, None)
         try:
-            with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(all_data, f, indent=4, ensure_ascii=False)
-            print(f"Notes saved to: {DATA_FILE}")
+            self.note_path(note_id).unlink(missing_ok=True)
         except Exception as e:
-            print(f"Error saving notes: {e}")
-            # Fallback: try to save in current directory
+            print(f"Error deleting note: {e}")
+
+    def migrate_legacy_notes(self):
+        """Split the old stickynotes_data.json into per-note files"""
+        # Move the old file aside first so the migration only ever runs once
+        backup_file = DATA_FILE.with_suffix(".json.bak")
+        try:
+            DATA_FILE.replace(backup_file)
+            with open(backup_file, 'rb') as f:
+                data_list = _loads(f.read())
+        except Exception as e:
+            print(f"Error migrating notes: {e}")
+            return
+
+        if not isinstance(data_list, list):
+            print("Error migrating notes: unexpected data format")
+            return
+        for note_data in data_list:
+            if not isinstance(note_data, dict):
+                print(f"Skipping invalid note entry: {note_data!r}")
+                continue
+            note_id = note_data.setdefault("id", uuid.uuid4().hex)
+            path = self.note_path(note_id)
+            # Never overwrite a note that already has its own file
+            if path.exists():
+                continue
             try:
-                with open("stickynotes_backup.json", 'w', encoding='utf-8') as f:
-                    json.dump(all_data, f, indent=4, ensure_ascii=False)
-                print("Backup saved to current directory")
-            except Exception as e2:
-                print(f"Backup also failed: {e2}")
+                _write_atomic(path, _dumps(note_data))
+            except Exception as e:
+                print(f"Error migrating note {note_id}: {e}")
+        print(f"Notes migrated to: {NOTES_DATA_FOLDER}")
 
     def load_notes(self):
-        """Load notes from JSON file in Documents/StickyNotes folder"""
+        """Load notes from per-note JSON files in Documents/StickyNotes/notes"""
         if DATA_FILE.exists():
+            self.migrate_legacy_notes()
+
+        # Build every window hidden, then show them all in one pass so Tk
+        # doesn't lay out and redraw each one while the next is created
+        self._loading = True
+        for path in sorted(NOTES_DATA_FOLDER.glob("*.json")):
             try:
-                with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                    data_list = json.load(f)
-                    if isinstance(data_list, list):
-                        for note_data in data_list:
-                            self.create_new_note(note_data)
-                print(f"Notes loaded from: {DATA_FILE}")
+                with open(path, 'rb') as f:
+                    note_data = _loads(f.read())
+                window = NoteWindow(self, note_data)
+                window.withdraw()
+                self.open_windows.append(window)
+                # What's on disk is already saved; don't rewrite it unchanged
+                self._saved_hashes[window.note_id] = self.note_hash({
+                    "theme": window.current_theme,
+                    "notes": window.notes_content,
+                    "todo": window.todo_items,
+                    "pos": note_data.get("pos", (50, 50)),
+                    "size": note_data.get("size", SMALL_SIZE),
+                })
             except Exception as e:
-                print(f"Error loading notes: {e}")
-                # Try to load from backup
-                try:
-                    backup_file = Path("stickynotes_backup.json")
-                    if backup_file.exists():
-                        with open(backup_file, 'r', encoding='utf-8') as f:
-                            data_list = json.load(f)
-                            if isinstance(data_list, list):
-                                for note_data in data_list:
-                                    self.create_new_note(note_data)
-                        print("Notes loaded from backup")
-                except Exception as e2:
-                    print(f"Backup load also failed: {e2}")
-
-
-class HoverButton(tk.Button):
-    """Enhanced Button with hover effects"""
+                print(f"Error loading note {path.name}: {e}")
 
-    def __init__(self, master, **kwargs):
-        self.hover_bg = kwargs.pop('hover_bg', None)
-        self.default_bg = kwargs.get('bg', '#f0f0f0')
-
-        super().__init__(master, **kwargs)
-
-        self.bind("<Enter>", self.on_enter)
-        self.bind("<Leave>", self.on_leave)
+        for window in self.open_windows:
+            window.deiconify()
+        self._loading = False
 
-        # Style for flat appearance
-        self.config(relief="flat", bd=1, cursor="hand2",
-                    activebackground=self.default_bg)
 
-    def on_enter(self, event):
-        if self.hover_bg:
-            self.config(bg=self.hover_bg)
+class HoverButton(ttk.Button):
+    """Flat button; its hover color comes from the ttk style's 'active' map"""
 
-    def on_leave(self, event):
-        self.config(bg=self.default_bg)
+    def __init__(self, master, **kwargs):
+        kwargs.setdefault('cursor', "hand2")
+        kwargs.setdefault('takefocus', False)
+        super().__init__(master, **kwargs)
 
 
 class NoteWindow(tk.Toplevel):
@@ -143,15 +305,19 @@ class NoteWindow(tk.Toplevel):
         self.protocol("WM_DELETE_WINDOW", self.on_close)
         self.title("Sticky Note")
 
-        self.uid = "S" + str(uuid.uuid4()).replace("-", "")
+        self._save_job = None
+        # Set only by real changes to content, theme or size
+        self._dirty = False
 
         # Load Data
         if data is None:
             data = {}
-        self.note_id = data.get("id", str(uuid.uuid4()))
+        self.note_id = data.get("id") or uuid.uuid4().hex
         self.current_theme = data.get("theme", DEFAULT_THEME)
         self.notes_content = data.get("notes", "")
-        self.todo_items = data.get("todo", [])
+        # Older saves stored the bullet with each item - strip it
+        self.todo_items = [t[len(TODO_BULLET):] if t.startswith(TODO_BULLET) else t
+                           for t in data.get("todo", [])]
         x, y = data.get("pos", (50, 50))
         w, h = data.get("size", SMALL_SIZE)
         self.geometry(f"{w}x{h}+{x}+{y}")
@@ -161,20 +327,29 @@ class NoteWindow(tk.Toplevel):
         self.bg_color, self.accent_color, self.text_color, self.hover_color = COLOR_THEMES[
             self.current_theme]
         self.config(bg=self.bg_color)
+        self.manager.setup_theme_styles(self.current_theme)
+
+        # Widgets recolored by apply_theme, registered as they're created
+        self._themed_bg = [self]       # bg = background
+        self._themed_accent = []       # bg = accent
+        self._themed_text = []         # (widget, bg attr) with text fg/cursor
+        self._themed_buttons = []      # (button, style name template)
 
         # --- ENHANCED CUSTOM TOP BAR ---
         self.top_bar = tk.Frame(self, bg=self.bg_color, height=35)
         self.top_bar.pack(side="top", fill="x")
         self.top_bar.pack_propagate(False)
+        self._themed_bg.append(self.top_bar)
 
         # Add a subtle shadow line under top bar
         self.shadow_line = tk.Frame(self, height=1, bg=self.accent_color)
         self.shadow_line.pack(side="top", fill="x")
+        self._themed_accent.append(self.shadow_line)
 
         self.setup_enhanced_menus()
 
         # --- NOTEBOOK ---
-        self.notebook = ttk.Notebook(self)
+        self.notebook = ttk.Notebook(self, style=NOTEBOOK_STYLE.format(self.current_theme))
         self.notebook.pack(expand=True, fill="both", padx=0, pady=0)
 
         self.create_note_page()
@@ -182,53 +357,82 @@ class NoteWindow(tk.Toplevel):
 
         # Apply Theme
         self.apply_theme(self.current_theme)
+        # Applying the initial theme isn't a change worth saving
+        self._dirty = False
 
         # Insert initial content after theme is applied
         if self.notes_content:
             self.text_area.insert("1.0", self.notes_content)
+            self.text_area.edit_modified(False)
 
         # Bindings for auto-save
         self.bind("<Double-Button-1>", self.toggle_size)
         self.bind("<FocusOut>", self.auto_save)
-        # Save when window is moved/resized
-        self.bind("<Configure>", self.auto_save)
+        # Position/size are read on demand by get_data(), so moves and
+        # resizes are picked up by the next save instead of via <Configure>
+        self.bind("<ButtonRelease-1>", self.auto_save)
 
-        # Auto-save when content changes
-        self.text_area.bind("<KeyRelease>", self.auto_save)
+        # Auto-save when content changes (not on every key press)
+        self.text_area.bind("<<Modified>>", self._on_modified)
 
         self.animating = False
 
     def auto_save(self, event=None):
-        """Auto-save when user makes changes"""
-        self.manager.save_all_notes()
+        """Schedule a debounced save; it only writes if the note is dirty"""
+        if self.manager._loading:
+            return
+        if self._save_job:
+            self.after_cancel(self._save_job)
+        self._save_job = self.after(SAVE_DELAY_MS, self._do_save)
+
+    def _on_modified(self, event=None):
+        # Resetting the flag fires <<Modified>> again; ignore that one
+        if not self.text_area.edit_modified():
+            return
+        self.text_area.edit_modified(False)
+        self._dirty = True
+        self.auto_save()
+
+    def _do_save(self):
+        self._save_job = None
+        self.manager.save_note(self)
+
+    def destroy(self):
+        # Drop any pending debounced save so it can't fire after teardown
+        if self._save_job:
+            self.after_cancel(self._save_job)
+            self._save_job = None
+        super().destroy()
 
     def setup_enhanced_menus(self):
         # File Menu Button with hover effects
         self.mb_file = HoverButton(self.top_bar, text="📁 File",
                                    command=self.show_file_menu,
-                                   bg=self.bg_color, fg=self.text_color,
-                                   hover_bg=self.hover_color,
-                                   font=("Segoe UI", 9, "bold"))
+                                   style=BAR_BTN_STYLE.format(self.current_theme))
         self.mb_file.pack(side="left", padx=(10, 0), pady=5)
 
         # Color Menu Button
         self.mb_color = HoverButton(self.top_bar, text="🎨 Color",
                                     command=self.show_color_menu,
-                                    bg=self.bg_color, fg=self.text_color,
-                                    hover_bg=self.hover_color,
-                                    font=("Segoe UI", 9, "bold"))
+                                    style=BAR_BTN_STYLE.format(self.current_theme))
         self.mb_color.pack(side="left", padx=(5, 0), pady=5)
 
         # Remove the standalone export button from top bar
         # Add resize button
         self.resize_btn = HoverButton(self.top_bar, text="⛶ Resize",
                                       command=self.toggle_size,
-                                      bg=self.bg_color, fg=self.text_color,
-                                      hover_bg=self.hover_color,
-                                      font=("Segoe UI", 9))
+                                      style=RESIZE_BTN_STYLE.format(self.current_theme))
         self.resize_btn.pack(side="right", padx=(0, 10), pady=5)
 
-        # Create menus (initially hidden)
+        self._themed_buttons.extend(((self.mb_file, BAR_BTN_STYLE),
+                                     (self.mb_color, BAR_BTN_STYLE),
+                                     (self.resize_btn, RESIZE_BTN_STYLE)))
+
+        # Menus are built on first use
+        self.file_menu = None
+        self.color_menu = None
+
+    def build_file_menu(self):
         self.file_menu = tk.Menu(self, tearoff=0, bg=self.accent_color, fg=self.text_color,
                                  font=("Segoe UI", 9), bd=1, relief="solid")
         self.file_menu.add_command(
@@ -242,18 +446,20 @@ class NoteWindow(tk.Toplevel):
         self.file_menu.add_command(
             label="🗑 Delete Note", command=self.delete_self)
 
+    def build_color_menu(self):
         self.color_menu = tk.Menu(self, tearoff=0, bg=self.accent_color, fg=self.text_color,
                                   font=("Segoe UI", 9), bd=1, relief="solid")
-        for t_name in COLOR_THEMES:
-            bg_color = COLOR_THEMES[t_name][0]
+        for t_name, (bg_color, _, _, hover) in zip(THEME_ORDER, THEME_TUPLES):
             self.color_menu.add_command(
                 label=f"● {t_name}",
-                command=lambda t=t_name: self.apply_theme(t),
+                command=partial(self.apply_theme, t_name),
                 background=bg_color,
-                activebackground=COLOR_THEMES[t_name][3]
+                activebackground=hover
             )
 
     def show_file_menu(self):
+        if self.file_menu is None:
+            self.build_file_menu()
         try:
             self.file_menu.tk_popup(
                 self.mb_file.winfo_rootx(),
@@ -263,6 +469,8 @@ class NoteWindow(tk.Toplevel):
             self.file_menu.grab_release()
 
     def show_color_menu(self):
+        if self.color_menu is None:
+            self.build_color_menu()
         try:
             self.color_menu.tk_popup(
                 self.mb_color.winfo_rootx(),
@@ -280,8 +488,8 @@ class NoteWindow(tk.Toplevel):
 
             note_data = self.get_data()
 
-            with open(note_filepath, 'w', encoding='utf-8') as f:
-                json.dump(note_data, f, indent=4, ensure_ascii=False)
+            with open(note_filepath, 'wb') as f:
+                f.write(_dumps(note_data, pretty=True))
 
             messagebox.showinfo("Export Successful",
                                 f"Note exported to:\n{note_filepath}")
@@ -291,17 +499,10 @@ class NoteWindow(tk.Toplevel):
     def open_notes_folder(self):
         """Open the StickyNotes folder in file explorer"""
         try:
-            os.startfile(NOTES_FOLDER)  # Windows
-        except:
-            try:
-                import subprocess
-                subprocess.run(['open', NOTES_FOLDER])  # macOS
-            except:
-                try:
-                    subprocess.run(['xdg-open', NOTES_FOLDER])  # Linux
-                except:
-                    messagebox.showinfo("Notes Folder",
-                                        f"Notes are saved in:\n{NOTES_FOLDER}")
+            _open_folder(NOTES_FOLDER)
+        except Exception:
+            messagebox.showinfo("Notes Folder",
+                                f"Notes are saved in:\n{NOTES_FOLDER}")
 
     def apply_theme(self, theme_name):
         self.current_theme = theme_name
@@ -309,83 +510,37 @@ class NoteWindow(tk.Toplevel):
             theme_name]
 
         # Update all UI elements
-        self.config(bg=self.bg_color)
-        self.top_bar.config(bg=self.bg_color)
-        self.shadow_line.config(bg=self.accent_color)
-
-        # Update hover buttons
-        for btn in [self.mb_file, self.mb_color, self.resize_btn]:
-            btn.config(bg=self.bg_color, fg=self.text_color)
-            btn.hover_bg = self.hover_color
-            btn.default_bg = self.bg_color
-
-        # Update menus
-        self.file_menu.config(bg=self.accent_color, fg=self.text_color)
-        self.color_menu.config(bg=self.accent_color, fg=self.text_color)
-
-        for i, t_name in enumerate(COLOR_THEMES):
-            bg_color = COLOR_THEMES[t_name][0]
-            self.color_menu.entryconfig(i,
-                                        background=bg_color,
-                                        activebackground=COLOR_THEMES[t_name][3])
-
-        # Notebook Style
-        style = ttk.Style()
-        style.theme_use('clam')
-        nb_style = f"{self.uid}.TNotebook"
-        tab_style = f"{self.uid}.TNotebook.Tab"
-
-        style.configure(nb_style, background=self.bg_color, borderwidth=0)
-        style.configure(tab_style,
-                        background=self.accent_color,
-                        foreground=self.text_color,
-                        padding=[20, 8],
-                        borderwidth=0,
-                        focuscolor=self.bg_color,
-                        font=("Segoe UI", 9, "bold"))
-        style.map(tab_style,
-                  background=[('selected', self.bg_color)],
-                  foreground=[('selected', self.text_color)])
-        self.notebook.config(style=nb_style)
-
-        # Update Content Widgets
-        if hasattr(self, 'note_frame'):
-            self.note_frame.config(bg=self.bg_color)
-        if hasattr(self, 'text_area'):
-            self.text_area.config(bg=self.bg_color, fg=self.text_color,
-                                  insertbackground=self.text_color)
-
-        # Update To-Do section - COMPLETELY recreate the todo list items with new colors
-        if hasattr(self, 'todo_frame'):
-            self.todo_frame.config(bg=self.bg_color)
-        if hasattr(self, 'todo_list'):
-            # Get current items
-            current_items = list(self.todo_list.get(0, tk.END))
-            # Clear and recreate the listbox with proper colors
+        for widget in self._themed_bg:
+            widget.config(bg=self.bg_color)
+        for widget in self._themed_accent:
+            widget.config(bg=self.accent_color)
+        for widget, bg_attr in self._themed_text:
+            widget.config(bg=getattr(self, bg_attr), fg=self.text_color,
+                          insertbackground=self.text_color)
+
+        # ttk widgets just switch to the theme's shared styles
+        self.manager.setup_theme_styles(theme_name)
+        self.notebook.config(style=NOTEBOOK_STYLE.format(theme_name))
+        for btn, style_name in self._themed_buttons:
+            btn.config(style=style_name.format(theme_name))
+
+        # Update menus (if they've been built yet)
+        if self.file_menu is not None:
+            self.file_menu.config(bg=self.accent_color, fg=self.text_color)
+        if self.color_menu is not None:
+            # Entry colors depend only on each entry's theme, so they stay as built
+            self.color_menu.config(bg=self.accent_color, fg=self.text_color)
+
+        # Update To-Do list - existing rows repaint with the new colors
+        if self.todo_list is not None:
             self.todo_list.config(bg=self.bg_color, fg=self.text_color,
                                   selectbackground=self.hover_color,
                                   selectforeground=self.text_color)
-            # Clear all items and reinsert them to apply new colors
-            self.todo_list.delete(0, tk.END)
-            for item in current_items:
-                self.todo_list.insert(tk.END, item)
-
-        if hasattr(self, 'todo_right_frame'):
-            self.todo_right_frame.config(bg=self.bg_color)
-        if hasattr(self, 'todo_entry'):
-            self.todo_entry.config(bg=self.accent_color, fg=self.text_color,
-                                   insertbackground=self.text_color)
-        if hasattr(self, 'add_btn'):
-            self.add_btn.config(bg=self.accent_color, fg=self.text_color)
-            self.add_btn.hover_bg = self.hover_color
-            self.add_btn.default_bg = self.accent_color
-        if hasattr(self, 'done_btn'):
-            self.done_btn.config(bg=self.accent_color, fg=self.text_color)
-            self.done_btn.hover_bg = self.hover_color
-            self.done_btn.default_bg = self.accent_color
-
-        # Save after theme change
-        self.manager.save_all_notes()
+
+        # Save after theme change - debounced, so clicking through themes
+        # only writes once
+        self._dirty = True
+        self.auto_save()
 
     def create_note_page(self):
         self.note_frame = tk.Frame(self.notebook, bg=self.bg_color)
@@ -404,10 +559,23 @@ class NoteWindow(tk.Toplevel):
                                  highlightthickness=1)
         self.text_area.pack(expand=True, fill="both")
 
+        self._themed_bg.extend((self.note_frame, text_container))
+        self._themed_text.append((self.text_area, 'bg_color'))
+
     def create_todo_page(self):
+        # Only the empty tab is created here; its widgets are built the
+        # first time the tab is opened
+        self.todo_list = None
         self.todo_frame = tk.Frame(self.notebook, bg=self.bg_color)
         self.notebook.add(self.todo_frame, text="✅ To-Do")
+        self._themed_bg.append(self.todo_frame)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
+    def on_tab_changed(self, event=None):
+        if self.todo_list is None and self.notebook.select() == str(self.todo_frame):
+            self.build_todo_widgets()
+
+    def build_todo_widgets(self):
         main_container = tk.Frame(self.todo_frame, bg=self.bg_color)
         main_container.pack(expand=True, fill="both", padx=10, pady=10)
 
@@ -426,8 +594,9 @@ class NoteWindow(tk.Toplevel):
         # NO SCROLLBAR - Simple packing
         self.todo_list.pack(side="left", expand=True, fill="both")
 
-        for item in self.todo_items:
-            self.todo_list.insert(tk.END, item)
+        # One Tcl call for all rows instead of one per item
+        if self.todo_items:
+            self.todo_list.insert(tk.END, *(TODO_BULLET + t for t in self.todo_items))
 
         # Right side - Controls
         self.todo_right_frame = tk.Frame(main_container, bg=self.bg_color)
@@ -441,56 +610,60 @@ class NoteWindow(tk.Toplevel):
                                    insertbackground=self.text_color)
         self.todo_entry.insert(0, "New task...")
         self.todo_entry.config(fg="#666666")
-        self.todo_entry.bind("<FocusIn>", lambda e: self.clear_placeholder())
-        self.todo_entry.bind(
-            "<FocusOut>", lambda e: self.restore_placeholder())
+        self.todo_entry.bind("<FocusIn>", self.clear_placeholder)
+        self.todo_entry.bind("<FocusOut>", self.restore_placeholder)
         # Enter key to add task
-        self.todo_entry.bind("<Return>", lambda e: self.add_todo())
+        self.todo_entry.bind("<Return>", self.add_todo)
         self.todo_entry.pack(pady=(0, 8))
 
         # Enhanced buttons
         self.add_btn = HoverButton(self.todo_right_frame, text="➕ Add",
                                    command=self.add_todo,
-                                   bg=self.accent_color, fg=self.text_color,
-                                   hover_bg=self.hover_color,
-                                   font=("Segoe UI", 9, "bold"),
-                                   width=12, height=1)
+                                   style=TODO_BTN_STYLE.format(self.current_theme),
+                                   width=12)
         self.add_btn.pack(pady=4, fill="x")
 
         self.done_btn = HoverButton(self.todo_right_frame, text="✅ Done",
                                     command=self.delete_todo_item,
-                                    bg=self.accent_color, fg=self.text_color,
-                                    hover_bg=self.hover_color,
-                                    font=("Segoe UI", 9, "bold"),
-                                    width=12, height=1)
+                                    style=TODO_BTN_STYLE.format(self.current_theme),
+                                    width=12)
         self.done_btn.pack(pady=4, fill="x")
+        self._themed_buttons.extend(((self.add_btn, TODO_BTN_STYLE),
+                                     (self.done_btn, TODO_BTN_STYLE)))
+
+        self._themed_bg.extend((main_container, list_container, self.todo_right_frame))
+        self._themed_text.append((self.todo_entry, 'accent_color'))
 
-    def clear_placeholder(self):
+    def clear_placeholder(self, event=None):
         if self.todo_entry.get() == "New task...":
             self.todo_entry.delete(0, tk.END)
             self.todo_entry.config(fg=self.text_color)
 
-    def restore_placeholder(self):
+    def restore_placeholder(self, event=None):
         if not self.todo_entry.get().strip():
             self.todo_entry.insert(0, "New task...")
             self.todo_entry.config(fg="#666666")
 
-    def add_todo(self):
+    def add_todo(self, event=None):
         item = self.todo_entry.get().strip()
         if item and item != "New task...":
-            self.todo_list.insert(tk.END, "● " + item)
+            self.todo_items.append(item)
+            self.todo_list.insert(tk.END, TODO_BULLET + item)
+            self._dirty = True
             self.todo_entry.delete(0, tk.END)
             self.restore_placeholder()
-            self.manager.save_all_notes()  # Auto-save after adding task
+            self.manager.save_note(self)  # Auto-save after adding task
 
     def delete_todo_item(self):
         for i in reversed(self.todo_list.curselection()):
             self.todo_list.delete(i)
-        self.manager.save_all_notes()  # Auto-save after deleting task
+            del self.todo_items[i]
+        self._dirty = True
+        self.manager.save_note(self)  # Auto-save after deleting task
 
     def delete_self(self):
         if messagebox.askyesno(APP_NAME, "Delete this note permanently?"):
-            self.manager.delete_note(self)
+            self.manager.close_note(self, delete=True)
 
     def toggle_size(self, event=None):
         if self.animating:
@@ -503,25 +676,22 @@ class NoteWindow(tk.Toplevel):
             self.geometry(f"{BIG_SIZE[0]}x{BIG_SIZE[1]}")
         self.is_expanded = not self.is_expanded
         self.animating = False
-        self.manager.save_all_notes()  # Auto-save after resizing
+        self._dirty = True
+        # Deferred so the new size has been applied when it's read back
+        self.auto_save()  # Auto-save after resizing
 
     def get_data(self):
         return {
             "id": self.note_id,
             "theme": self.current_theme,
             "notes": self.text_area.get("1.0", tk.END).strip(),
-            "todo": list(self.todo_list.get(0, tk.END)),
+            "todo": list(self.todo_items),
             "pos": (self.winfo_x(), self.winfo_y()),
             "size": (self.winfo_width(), self.winfo_height())
         }
 
     def on_close(self):
-        self.manager.save_all_notes()  # Auto-save when closing
-        self.destroy()
-        if self in self.manager.open_windows:
-            self.manager.open_windows.remove(self)
-        if not self.manager.open_windows:
-            self.manager.root.destroy()
+        self.manager.close_note(self)  # Auto-save when closing
 
 
 if __name__ == "__main__":